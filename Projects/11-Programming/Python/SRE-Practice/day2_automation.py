@@ -36,6 +36,20 @@ HINTS:
 - Categorize based on percentage thresholds
 """
 
+from instrumentation import count, export_prometheus, is_enabled, span
+
+# Sample data (simulating disk usage % per server)
+SAMPLE_SERVERS = {
+    'web-01': 75,
+    'web-02': 85,
+    'db-01': 92,
+    'cache-01': 45,
+    'api-01': 88,
+    'db-02': 95,
+    'log-server': 78
+}
+
+
 def monitor_disk_usage(servers):
     """
     Monitor disk usage and categorize servers.
@@ -52,13 +66,16 @@ def monitor_disk_usage(servers):
     critical=[]
     healthy=[]
 
-    for server,usage in servers.items():
-        if usage>90:
-            critical.append(server)
-        elif usage>80:
-            warning.append(server)
-        else:
-            healthy.append(server)
+    with span('disk_monitor.classify'):
+        for server,usage in servers.items():
+            if usage>90:
+                critical.append(server)
+            elif usage>80:
+                warning.append(server)
+            else:
+                healthy.append(server)
+    count('disk_monitor.servers', len(servers))
+    count('disk_monitor.critical', len(critical))
     return {
         'warning': warning,
         'critical': critical,
@@ -109,14 +126,23 @@ HINTS:
 
 from datetime import datetime, timedelta
 
+# Sample data (simulating backup size in GB per database)
+SAMPLE_DATABASES = {
+    'users_db': 50,
+    'orders_db': 120,
+    'logs_db': 200
+}
+
 def calculate_backup_time(databases, network_speed_gbph):
     database_time={}
     total_time=0
     current_time=datetime.now()
-    for db,size in databases.items():
-        time=size/network_speed_gbph
-        database_time[db]=time
-        total_time+=time
+    with span('backup_calculator.plan'):
+        for db,size in databases.items():
+            time=size/network_speed_gbph
+            database_time[db]=time
+            total_time+=time
+    count('backup_calculator.databases', len(databases))
     estimated_completion=current_time+timedelta(hours=total_time)
     return {
         'databases':database_time,
@@ -149,17 +175,7 @@ if __name__ == "__main__":
     print("\n📊 Problem 1: Disk Space Monitor")
     print("-" * 40)
     
-    servers = {
-        'web-01': 75,
-        'web-02': 85,
-        'db-01': 92,
-        'cache-01': 45,
-        'api-01': 88,
-        'db-02': 95,
-        'log-server': 78
-    }
-    
-    result1 = monitor_disk_usage(servers)
+    result1 = monitor_disk_usage(SAMPLE_SERVERS)
     
     if result1:
         print(f"🟢 Healthy servers: {result1.get('healthy', [])}")
@@ -175,13 +191,7 @@ if __name__ == "__main__":
     print("📊 Problem 2: Backup Time Calculator")
     print("-" * 40)
     
-    databases = {
-        'users_db': 50,
-        'orders_db': 120,
-        'logs_db': 200
-    }
-    
-    result2 = calculate_backup_time(databases, network_speed_gbph=10)
+    result2 = calculate_backup_time(SAMPLE_DATABASES, network_speed_gbph=10)
     
     if result2:
         print("Backup times per database:")
@@ -215,3 +225,7 @@ Backup times per database:
 Total backup time: 37.0 hours
 Estimated completion: 2026-01-08 XX:XX:XX (current + 37h)
 """)
+
+    if is_enabled():
+        print("\n📈 Instrumentation:")
+        print(export_prometheus())
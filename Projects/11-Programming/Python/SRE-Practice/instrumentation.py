@@ -0,0 +1,315 @@
+# SRE/DevOps Python Practice - Instrumentation
+# Using modules: time, threading, json, os, collections
+
+"""
+Hot-Path Instrumentation
+========================
+
+Opt-in timing spans and counters for the SRE tools (log analyzer,
+health checker, disk monitor, backup calculator).
+
+Instrumentation is DISABLED by default. While disabled, span() hands back a
+shared no-op context manager and count() returns immediately, so the cost on
+the hot path is one global lookup and a function call.
+
+Enable it with:
+    - instrumentation.enable() in code, or
+    - SRE_INSTRUMENT=1 in the environment
+
+Usage:
+    from instrumentation import span, count, export_prometheus
+
+    with span('log_analyzer.parse'):
+        ...
+    count('log_analyzer.lines', len(lines))
+
+    print(export_prometheus())
+
+Span durations are aggregated in-process into HDR-style (log-linear)
+latency histograms: every power-of-two range is split into a fixed number
+of linear sub-buckets, so relative error is bounded no matter the magnitude.
+Prometheus export collapses them into a fixed set of power-of-two buckets.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+_enabled = os.environ.get('SRE_INSTRUMENT', '').lower() in ('1', 'true', 'yes')
+_lock = threading.Lock()
+_histograms = {}
+_counters = Counter()
+
+# Fixed Prometheus buckets: below 2**10 ns (~1 us) up to below 2**36 ns (~69 s)
+PROMETHEUS_MIN_EXP = 10
+PROMETHEUS_MAX_EXP = 36
+
+
+def enable():
+    """Turn instrumentation on."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Turn instrumentation off. Already collected data is kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drop all collected histograms and counters."""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations in nanoseconds.
+
+    Values below 2**sub_bucket_bits land in exact linear buckets. Above that,
+    each power-of-two range [2**k, 2**(k+1)) is split into 2**(sub_bucket_bits-1)
+    equal sub-buckets, which keeps relative error under 2**-(sub_bucket_bits-1)
+    (about 1.6% with the default of 7 bits).
+    """
+
+    __slots__ = ('sub_bucket_bits', 'buckets', 'count', 'total', 'min', 'max')
+
+    def __init__(self, sub_bucket_bits=7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        # Keep the top sub_bucket_bits of the value, remember the shift
+        return (shift << self.sub_bucket_bits) | (value >> shift)
+
+    def _upper_bound(self, index):
+        shift = index >> self.sub_bucket_bits
+        if shift == 0:
+            return index
+        mantissa = index & ((1 << self.sub_bucket_bits) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value):
+        value = max(int(value), 0)
+        self.buckets[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """Return the upper bound (ns) of the bucket holding the p-th percentile."""
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(p / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def power_of_two_buckets(self, min_exp=PROMETHEUS_MIN_EXP, max_exp=PROMETHEUS_MAX_EXP):
+        """
+        Collapse into fixed buckets: yield (2**k - 1, cumulative_count) for
+        every k in [min_exp, max_exp], i.e. the count of values below 2**k ns.
+
+        Every HDR bucket sits inside one power-of-two range, so this is exact.
+        The bucket set is the same for every histogram, whatever was recorded.
+        """
+        per_exp = Counter()
+        for index, bucket_count in self.buckets.items():
+            per_exp[max(self._upper_bound(index).bit_length(), min_exp)] += bucket_count
+        seen = 0
+        for exp in range(min_exp, max_exp + 1):
+            seen += per_exp[exp]
+            yield (1 << exp) - 1, seen
+
+    def merge(self, summary):
+        """Add a summary() taken with include_buckets=True from another histogram."""
+        if summary['sub_bucket_bits'] != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different sub_bucket_bits")
+        self.buckets.update(summary['buckets'])
+        self.count += summary['count']
+        self.total += summary['sum_ns']
+        if summary['count']:
+            if self.min is None or summary['min_ns'] < self.min:
+                self.min = summary['min_ns']
+            self.max = max(self.max, summary['max_ns'])
+
+    def summary(self, include_buckets=False):
+        summary = {
+            'count': self.count,
+            'sum_ns': self.total,
+            'min_ns': self.min or 0,
+            'max_ns': self.max,
+            'p50_ns': self.percentile(50),
+            'p90_ns': self.percentile(90),
+            'p99_ns': self.percentile(99),
+            'p999_ns': self.percentile(99.9),
+        }
+        if include_buckets:
+            summary['sub_bucket_bits'] = self.sub_bucket_bits
+            summary['buckets'] = dict(self.buckets)
+        return summary
+
+
+class _NullSpan:
+    """Shared no-op context manager used while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+def span(name):
+    """Time a block of code under `name`. No-op when disabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def record(name, duration_ns):
+    """Record a duration (ns) into the histogram for `name`."""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        histogram.record(duration_ns)
+
+
+def count(name, value=1):
+    """Increment counter `name` by `value`. No-op when disabled."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] += value
+
+
+def snapshot(include_buckets=False):
+    """
+    Return collected data as a plain dict:
+    {
+        'spans': {'log_analyzer.parse': {'count': 1, 'p50_ns': ..., ...}},
+        'counters': {'log_analyzer.lines': 15}
+    }
+    With include_buckets=True every span also carries its raw HDR buckets,
+    so the snapshot can be merge()d into another process.
+    """
+    with _lock:
+        return {
+            'spans': {name: h.summary(include_buckets) for name, h in sorted(_histograms.items())},
+            'counters': dict(sorted(_counters.items())),
+        }
+
+
+def merge(data):
+    """
+    Add a snapshot(include_buckets=True) taken elsewhere, e.g. in a worker
+    process, into this process's histograms and counters.
+    """
+    with _lock:
+        for name, summary in data['spans'].items():
+            histogram = _histograms.get(name)
+            if histogram is None:
+                histogram = _histograms[name] = LatencyHistogram(summary['sub_bucket_bits'])
+            histogram.merge(summary)
+        _counters.update(data['counters'])
+
+
+def export_json():
+    return json.dumps(snapshot(), indent=4)
+
+
+def _metric_name(name):
+    return 'sre_' + ''.join(c if c.isalnum() else '_' for c in name)
+
+
+def export_prometheus():
+    """
+    Render spans and counters in the Prometheus text exposition format.
+
+    Span histograms use the fixed power-of-two buckets from
+    LatencyHistogram.power_of_two_buckets(), so the series stay the same
+    between scrapes. Full HDR resolution is kept in snapshot()/export_json().
+    """
+    lines = []
+    with _lock:
+        if _histograms:
+            lines.append('# HELP sre_span_seconds Duration of instrumented spans.')
+            lines.append('# TYPE sre_span_seconds histogram')
+            for name, histogram in sorted(_histograms.items()):
+                for upper_ns, cumulative in histogram.power_of_two_buckets():
+                    lines.append(
+                        f'sre_span_seconds_bucket{{span="{name}",le="{upper_ns / 1e9:.9g}"}} {cumulative}'
+                    )
+                lines.append(f'sre_span_seconds_bucket{{span="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'sre_span_seconds_sum{{span="{name}"}} {histogram.total / 1e9:.9g}')
+                lines.append(f'sre_span_seconds_count{{span="{name}"}} {histogram.count}')
+        for name, value in sorted(_counters.items()):
+            metric = _metric_name(name) + '_total'
+            lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+# ==================================================
+# TEST
+# ==================================================
+
+if __name__ == "__main__":
+    enable()
+
+    for i in range(1000):
+        with span('demo.loop'):
+            sum(range(i))
+        count('demo.iterations')
+
+    print("=" * 50)
+    print("INSTRUMENTATION DEMO")
+    print("=" * 50)
+    print("\n📈 JSON:")
+    print(export_json())
+    print("\n📈 Prometheus (first lines):")
+    print('\n'.join(export_prometheus().splitlines()[:5]))
@@ -0,0 +1,299 @@
+# SRE/DevOps Python Practice - Log Index
+# Using modules: array, bisect, json, os, re
+
+"""
+Indexed Log Search
+==================
+
+After analyze_logs reports "OutOfMemoryError: Java heap space x3", we want the
+matching lines without grepping the whole file again.
+
+LogIndex is a sidecar index filled in while the analyzer parses:
+    - levels:     {level: [byte offsets]}       posting lists
+    - templates:  {template: [byte offsets]}    numbers collapsed to <*>
+    - timestamps: [(timestamp, byte offset)]    sparse, every Nth line
+
+Queries intersect the posting lists, narrow them to the byte range the
+sparse timestamp index allows, then seek() straight to each line.
+
+Usage:
+    index = LogIndex()
+    analyze_log_file('app.log', index=index)
+    index.save('app.log')                    # writes app.log.idx
+
+    index = LogIndex.load('app.log')
+    index.query('app.log', level='ERROR',
+                template='OutOfMemoryError: Java heap space',
+                start='2026-01-07 10:00:00', end='2026-01-07 10:05:00')
+
+Assumes log lines are written in timestamp order (normal for append-only logs).
+Timestamps are compared as 'YYYY-MM-DD HH:MM:SS' strings.
+"""
+
+import json
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+SIDECAR_SUFFIX = '.idx'
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+def message_template(message):
+    """
+    Collapse the variable parts of a message so similar lines share a template.
+
+    'Slow query detected: 3.5 seconds' -> 'Slow query detected: <*> seconds'
+    """
+    return _NUMBER.sub('<*>', message)
+
+
+def _sidecar_path(log_path):
+    return log_path + SIDECAR_SUFFIX
+
+
+def _narrow(postings, low, high):
+    """Slice a sorted offset array down to [low, high)."""
+    first = bisect_left(postings, low)
+    last = len(postings) if high is None else bisect_left(postings, high)
+    return postings[first:last]
+
+
+def _intersect(a, b):
+    """Intersect two sorted offset arrays."""
+    if len(a) > len(b):
+        a, b = b, a
+    lookup = set(b)
+    return array('Q', (offset for offset in a if offset in lookup))
+
+
+class LogIndex:
+    """Posting lists of byte offsets per level and per message template."""
+
+    def __init__(self, timestamp_every=1024):
+        self.timestamp_every = timestamp_every
+        self.levels = {}
+        self.templates = {}
+        self.timestamps = []
+        self.line_count = 0
+        # Size of the log (bytes) covered by this index, set by the analyzer
+        self.indexed_bytes = 0
+
+    def add(self, offset, timestamp, level, message):
+        """Record one parsed line starting at byte `offset`."""
+        postings = self.levels.get(level)
+        if postings is None:
+            postings = self.levels[level] = array('Q')
+        postings.append(offset)
+
+        template = message_template(message)
+        postings = self.templates.get(template)
+        if postings is None:
+            postings = self.templates[template] = array('Q')
+        postings.append(offset)
+
+        # The sparse index is bisected, so it must never go backwards
+        if self.line_count % self.timestamp_every == 0:
+            if not self.timestamps or timestamp >= self.timestamps[-1][0]:
+                self.timestamps.append((timestamp, offset))
+        self.line_count += 1
+
+    # ----------------------------------------------
+    # Sidecar file
+    # ----------------------------------------------
+
+    def save(self, log_path):
+        """Write the index next to the log file and return the sidecar path."""
+        sidecar = _sidecar_path(log_path)
+        header = {
+            'indexed_bytes': self.indexed_bytes,
+            'timestamp_every': self.timestamp_every,
+            'line_count': self.line_count,
+            'timestamps': self.timestamps,
+            'levels': {k: len(v) for k, v in self.levels.items()},
+            'templates': {k: len(v) for k, v in self.templates.items()},
+        }
+        # One JSON header line, then the raw posting lists in header order
+        with open(sidecar, 'wb') as f:
+            f.write(json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n')
+            for postings in list(self.levels.values()) + list(self.templates.values()):
+                postings.tofile(f)
+        return sidecar
+
+    @classmethod
+    def load(cls, log_path):
+        """
+        Load the sidecar index for `log_path`. Raises ValueError if stale,
+        i.e. the log is no longer exactly the size that was indexed.
+        """
+        with open(_sidecar_path(log_path), 'rb') as f:
+            header = json.loads(f.readline())
+            if header['indexed_bytes'] != os.path.getsize(log_path):
+                raise ValueError(f"Index for {log_path} is stale, rebuild it")
+            index = cls(timestamp_every=header['timestamp_every'])
+            index.line_count = header['line_count']
+            index.indexed_bytes = header['indexed_bytes']
+            index.timestamps = [tuple(entry) for entry in header['timestamps']]
+            for section in ('levels', 'templates'):
+                postings_by_key = getattr(index, section)
+                for key, length in header[section].items():
+                    postings = array('Q')
+                    postings.fromfile(f, length)
+                    postings_by_key[key] = postings
+        return index
+
+    # ----------------------------------------------
+    # Query
+    # ----------------------------------------------
+
+    def _byte_range(self, start, end):
+        """Byte range [low, high) that can hold lines between start and end."""
+        stamps = [ts for ts, _ in self.timestamps]
+        low, high = 0, None
+        if start is not None:
+            i = bisect_left(stamps, start) - 1
+            if i >= 0:
+                low = self.timestamps[i][1]
+        if end is not None:
+            i = bisect_right(stamps, end)
+            if i < len(stamps):
+                high = self.timestamps[i][1]
+        return low, high
+
+    def query(self, log_path, level=None, template=None, start=None, end=None):
+        """
+        Return matching lines (without newline) from `log_path`.
+
+        template may be a template from self.templates or a raw message;
+        raw messages are normalized with message_template().
+        """
+        low, high = self._byte_range(start, end)
+        candidates = None
+        if level is not None:
+            candidates = _narrow(self.levels.get(level, array('Q')), low, high)
+        if template is not None:
+            postings = _narrow(self.templates.get(message_template(template), array('Q')), low, high)
+            candidates = postings if candidates is None else _intersect(candidates, postings)
+
+        results = []
+        with open(log_path, 'rb') as f:
+            if candidates is None:
+                # Time range only: read the narrowed slice sequentially
+                f.seek(low)
+                offset = low
+                for raw in f:
+                    if high is not None and offset >= high:
+                        break
+                    offset += len(raw)
+                    line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                    if _in_range(line, start, end):
+                        results.append(line)
+                return results
+
+            for offset in candidates:
+                f.seek(offset)
+                line = f.readline().decode('utf-8', 'replace').rstrip('\r\n')
+                if _in_range(line, start, end):
+                    results.append(line)
+        return results
+
+
+def _in_range(line, start, end):
+    timestamp = line[:19]
+    if start is not None and timestamp < start:
+        return False
+    if end is not None and timestamp > end:
+        return False
+    return True
+
+
+# ==================================================
+# BENCHMARK
+# ==================================================
+
+def _write_sample_log(path, target_bytes):
+    """Write a synthetic log of roughly target_bytes, one line per second."""
+    from datetime import datetime, timedelta
+    from problem1_log_analyzer import SAMPLE_LOGS
+
+    messages = [line.split(' ', 2)[2] for line in SAMPLE_LOGS.split('\n')]
+    current = datetime(2026, 1, 7)
+    second = timedelta(seconds=1)
+    written = 0
+    i = 0
+    with open(path, 'w') as f:
+        while written < target_bytes:
+            chunk = []
+            for _ in range(10000):
+                line = f"{current:%Y-%m-%d %H:%M:%S} {messages[i % len(messages)]}\n"
+                chunk.append(line)
+                current += second
+                i += 1
+            block = ''.join(chunk)
+            f.write(block)
+            written += len(block)
+
+
+def _rescan(path, level, template, start, end):
+    """Baseline: scan the whole file, same predicate as LogIndex.query."""
+    results = []
+    template = message_template(template)
+    with open(path, 'rb') as f:
+        for raw in f:
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            parts = line.split(' ', 3)
+            if len(parts) < 4 or parts[2] != level:
+                continue
+            if message_template(parts[3]) == template and _in_range(line, start, end):
+                results.append(line)
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from problem1_log_analyzer import analyze_log_file
+
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    path = os.path.join(tempfile.mkdtemp(), 'bench.log')
+
+    print("=" * 50)
+    print(f"LOG INDEX BENCHMARK ({size_mb:.0f} MB)")
+    print("=" * 50)
+
+    _write_sample_log(path, int(size_mb * 1024 * 1024))
+
+    begin = time.perf_counter()
+    index = LogIndex()
+    analyze_log_file(path, index=index)
+    index.save(path)
+    print(f"Analyze + build index: {time.perf_counter() - begin:.2f}s")
+
+    query = dict(level='ERROR', template='OutOfMemoryError: Java heap space',
+                 start='2026-01-07 10:00:00', end='2026-01-07 10:05:00')
+
+    begin = time.perf_counter()
+    index = LogIndex.load(path)
+    load_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    indexed = index.query(path, **query)
+    indexed_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    scanned = _rescan(path, **query)
+    scan_time = time.perf_counter() - begin
+
+    assert indexed == scanned
+    print(f"Matches: {len(indexed)}")
+    print(f"Index load:    {load_time * 1000:.1f} ms")
+    print(f"Indexed query: {indexed_time * 1000:.1f} ms")
+    print(f"Full rescan:   {scan_time * 1000:.1f} ms")
+    print(f"Speedup (query only): {scan_time / indexed_time:.0f}x")
+    print(f"Speedup (load + query): {scan_time / (load_time + indexed_time):.0f}x")
+
+    os.remove(path)
+    os.remove(_sidecar_path(path))
@@ -22,8 +22,11 @@ HINTS:
 - Use split() to extract parts of each line
 """
 
+import re
 from collections import Counter
 
+from instrumentation import count, export_prometheus, is_enabled, span
+
 # Sample log data (simulating a log file)
 SAMPLE_LOGS = """2026-01-07 10:00:01 INFO Starting application server on port 8080
 2026-01-07 10:00:02 INFO Database connection established
@@ -42,32 +45,104 @@ SAMPLE_LOGS = """2026-01-07 10:00:01 INFO Starting application server on port 80
 2026-01-07 10:01:05 WARNING Rate limit exceeded"""
 
 
-def analyze_logs(log_text):
+_TIMESTAMP = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+
+def _with_offsets(lines, offset):
+    """Pair each line with the byte offset it starts at."""
+    for line in lines:
+        yield offset, line
+        offset += len(line.encode('utf-8')) + 1
+
+
+def _parse_lines(numbered_lines, index=None):
     """
-    Analyze log text and return:
-    - counts: dict with count of each log level
-    - top_errors: list of top 3 error messages with counts
-    - error_rate: percentage of ERROR lines
-    
-    TODO: Implement this function
+    Count levels and collect error messages from (byte_offset, line) pairs.
+    If an index is given, every parsed line is also added to it.
+
+    Only lines starting with a 'YYYY-MM-DD HH:MM:SS LEVEL' header are parsed.
+    Everything else (blank lines, stack-trace continuations such as
+    '    at com.foo.Bar(Bar.java:42)' or 'Caused by: ...') is skipped.
     """
-    lines = log_text.strip().split('\n')
-    log_levels =Counter()
-    errors=[]
-    for line in lines:
+    log_levels = Counter()
+    errors = []
+    total = 0
+    skipped = 0
+    for offset, line in numbered_lines:
         parts = line.split()
+        if len(parts) < 3:
+            skipped += 1
+            continue
+        timestamp = parts[0] + ' ' + parts[1]
+        if not _TIMESTAMP.fullmatch(timestamp):
+            skipped += 1
+            continue
+        total += 1
         level = parts[2]
-        log_levels[level]+=1
-        if level == 'ERROR':
+        log_levels[level] += 1
+        if level == 'ERROR' or index is not None:
             error_msg = ' '.join(parts[3:])
-            errors.append(error_msg)
-    
-    error_counter = Counter(errors)
-    top_errors = error_counter.most_common(3)
-    error_rate = log_levels['ERROR'] / len(lines) * 100
+            if level == 'ERROR':
+                errors.append(error_msg)
+            if index is not None:
+                index.add(offset, timestamp, level, error_msg)
+    count('log_analyzer.lines', total)
+    count('log_analyzer.errors', len(errors))
+    count('log_analyzer.skipped', skipped)
+    return log_levels, errors, total
+
+
+def _summarize(log_levels, errors, total):
+    with span('log_analyzer.aggregate'):
+        error_counter = Counter(errors)
+        top_errors = error_counter.most_common(3)
+        error_rate = log_levels['ERROR'] / total * 100 if total else 0.0
     return log_levels, top_errors, error_rate
 
 
+def analyze_logs(log_text, index=None):
+    """
+    Analyze log text and return:
+    - counts: dict with count of each log level
+    - top_errors: list of top 3 error messages with counts
+    - error_rate: percentage of ERROR lines
+
+    If index (a log_index.LogIndex) is given, it is filled with the byte
+    offset of every line within log_text encoded as UTF-8.
+    """
+    with span('log_analyzer.parse'):
+        lines = log_text.strip().split('\n')
+        if index is None:
+            numbered = ((None, line) for line in lines)
+        else:
+            leading = log_text[:len(log_text) - len(log_text.lstrip())]
+            numbered = _with_offsets(lines, len(leading.encode('utf-8')))
+            index.indexed_bytes = len(log_text.encode('utf-8'))
+        log_levels, errors, total = _parse_lines(numbered, index)
+    return _summarize(log_levels, errors, total)
+
+
+def analyze_log_file(path, index=None):
+    """
+    Same as analyze_logs, but streams the file at `path` line by line
+    instead of loading it into memory. Use this to build a LogIndex for
+    large files.
+    """
+    def numbered_lines(f):
+        offset = 0
+        for raw in f:
+            yield offset, raw.decode('utf-8', 'replace')
+            offset += len(raw)
+        # Record where indexing stopped; the file may keep growing
+        if index is not None:
+            index.indexed_bytes = offset
+
+    with span('log_analyzer.parse'):
+        with open(path, 'rb') as f:
+            log_levels, errors, total = _parse_lines(numbered_lines(f), index)
+    return _summarize(log_levels, errors, total)
+
+
     
     
 
@@ -112,5 +187,9 @@ if __name__ == "__main__":
 
 ⚠️ Error Rate: 40.0%
 """)
+
+        if is_enabled():
+            print("\n📈 Instrumentation:")
+            print(export_prometheus())
     else:
         print("Implement the analyze_logs function!")
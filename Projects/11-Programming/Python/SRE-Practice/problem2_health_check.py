@@ -27,6 +27,12 @@ HINTS:
 import json
 from datetime import datetime
 
+from instrumentation import count, export_prometheus, is_enabled, span
+
+# A service is healthy with this status code and a faster response (seconds)
+HEALTHY_STATUS = 200
+MAX_RESPONSE_TIME = 2
+
 # Simulated service responses (in real life, you'd use requests.get())
 SERVICES = {
     'api-server': {'status': 200, 'response_time': 0.5},
@@ -49,7 +55,7 @@ def is_healthy(service_name, service_data):
     TODO: Implement this function
     Return: True if healthy, False otherwise
     """
-    if service_data['status'] == 200 and service_data['response_time'] < 2:
+    if service_data['status'] == HEALTHY_STATUS and service_data['response_time'] < MAX_RESPONSE_TIME:
         return True
     return False
 
@@ -77,13 +83,17 @@ def run_health_check(services):
     health_count=0
     unhealthy_count = 0
     services_list=[]
-    for srvice_name in services:
-        service_data=services[srvice_name]
-        if is_healthy(srvice_name, service_data):
-            health_count+=1
-        else:
-            unhealthy_count+=1
-        services_list.append({'name': srvice_name, 'status': 'healthy' if is_healthy(srvice_name, service_data) else 'unhealthy'})
+    with span('health_check.evaluate'):
+        for srvice_name in services:
+            service_data=services[srvice_name]
+            healthy = is_healthy(srvice_name, service_data)
+            if healthy:
+                health_count+=1
+            else:
+                unhealthy_count+=1
+            services_list.append({'name': srvice_name, 'status': 'healthy' if healthy else 'unhealthy'})
+    count('health_check.services', total_services)
+    count('health_check.unhealthy', unhealthy_count)
     return {'timestamp': time_stamp, 'total_services': total_services, 'healthy_count': health_count, 'unhealthy_count': unhealthy_count, 'services': services_list}
 
 
@@ -94,7 +104,8 @@ def generate_report(health_data):
     TODO: Implement this function
     Return: JSON string (pretty-printed)
     """
-    return json.dumps(health_data, indent=4)
+    with span('health_check.serialize'):
+        return json.dumps(health_data, indent=4)
 
 
 # ==================================================
@@ -156,5 +167,9 @@ SUMMARY:
   - cache-redis
   - notification
 """)
+
+        if is_enabled():
+            print("\n📈 Instrumentation:")
+            print(export_prometheus())
     else:
         print("\nImplement the functions to see results!")
@@ -0,0 +1,223 @@
+# SRE/DevOps Python Practice - Compact Service Registry
+# Using modules: array, sys, gc, tracemalloc
+
+"""
+Compact Service Registry
+========================
+
+SERVICES in problem2_health_check.py is a dict of dicts, and run_health_check
+builds a list of dicts. With 100k+ services the per-record dicts dominate
+memory and make every full garbage collection slower.
+
+ServiceRegistry stores services column by column instead:
+    - names:         list of interned strings
+    - status:        array('H')   (unsigned 16-bit, HTTP status codes)
+    - response_time: array('d')   (seconds)
+
+Arrays hold raw numbers, not Python objects, so apart from the names list
+there is nothing per service for the GC to walk. ServiceRecord (a __slots__
+class) is only created when you look up a single service.
+
+Usage:
+    registry = ServiceRegistry.from_dict(SERVICES)
+    registry.add('search', 200, 0.4)
+
+    report = registry.health_check()          # same format as run_health_check
+    report = registry.health_check(include_services=False)   # counts only
+
+run_health_check(registry) also works, since the registry can be iterated by
+name and indexed like the SERVICES dict. add() rejects duplicate names.
+"""
+
+import sys
+from array import array
+from datetime import datetime
+
+from instrumentation import count, span
+from problem2_health_check import HEALTHY_STATUS, MAX_RESPONSE_TIME
+
+
+class ServiceRecord:
+    """One service. Supports record['status'] so is_healthy() accepts it."""
+
+    __slots__ = ('name', 'status', 'response_time')
+
+    def __init__(self, name, status, response_time):
+        self.name = name
+        self.status = status
+        self.response_time = response_time
+
+    def __getitem__(self, key):
+        if key not in ServiceRecord.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"ServiceRecord({self.name!r}, {self.status}, {self.response_time})"
+
+
+class ServiceRegistry:
+    """Columnar store of service names, status codes and response times."""
+
+    def __init__(self):
+        self.names = []
+        self.status = array('H')
+        self.response_time = array('d')
+        self._positions = {}
+
+    @classmethod
+    def from_dict(cls, services):
+        """Build from the SERVICES format: {name: {'status': ..., 'response_time': ...}}."""
+        registry = cls()
+        for name, service_data in services.items():
+            registry.add(name, service_data['status'], service_data['response_time'])
+        return registry
+
+    def add(self, name, status, response_time):
+        """
+        Append one service. Everything is validated before any column is
+        touched, so a bad value can never leave the columns out of step.
+        Raises ValueError for a duplicate name or an out-of-range status.
+        """
+        if not isinstance(name, str):
+            raise TypeError(f"name must be a str, got {type(name).__name__}")
+        if name in self._positions:
+            raise ValueError(f"Duplicate service name: {name!r}")
+        if isinstance(status, bool) or not isinstance(status, int):
+            raise TypeError(f"status must be an int, got {type(status).__name__}")
+        if not 0 <= status <= 65535:
+            raise ValueError(f"status must be in 0-65535, got {status}")
+        if isinstance(response_time, bool) or not isinstance(response_time, (int, float)):
+            raise TypeError(f"response_time must be a float, got {type(response_time).__name__}")
+
+        name = sys.intern(name)
+        self._positions[name] = len(self.names)
+        self.names.append(name)
+        self.status.append(status)
+        self.response_time.append(response_time)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, name):
+        i = self._positions[name]
+        return ServiceRecord(self.names[i], self.status[i], self.response_time[i])
+
+    def healthy_mask(self):
+        """bytearray with 1 for every healthy service, in registry order."""
+        return bytearray(
+            status == HEALTHY_STATUS and response_time < MAX_RESPONSE_TIME
+            for status, response_time in zip(self.status, self.response_time)
+        )
+
+    def health_check(self, include_services=True):
+        """
+        Run the health check and return the run_health_check report format.
+        With include_services=False the (large) 'services' list is skipped.
+        """
+        time_stamp = datetime.now().isoformat()
+        total_services = len(self.names)
+        with span('health_check.evaluate'):
+            mask = self.healthy_mask()
+            health_count = sum(mask)
+        unhealthy_count = total_services - health_count
+        count('health_check.services', total_services)
+        count('health_check.unhealthy', unhealthy_count)
+
+        report = {'timestamp': time_stamp, 'total_services': total_services, 'healthy_count': health_count, 'unhealthy_count': unhealthy_count}
+        if include_services:
+            report['services'] = [
+                {'name': name, 'status': 'healthy' if healthy else 'unhealthy'}
+                for name, healthy in zip(self.names, mask)
+            ]
+        return report
+
+
+# ==================================================
+# BENCHMARK
+# ==================================================
+
+def _sample_services(n):
+    """n services in the SERVICES dict format, 1 in 5 unhealthy."""
+    statuses = [200, 200, 200, 200, 503]
+    return {
+        f'service-{i:07d}': {'status': statuses[i % 5], 'response_time': (i % 40) / 10}
+        for i in range(n)
+    }
+
+
+def _measure(build):
+    """Return (result, bytes allocated by build())."""
+    import tracemalloc
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def _gc_pause(runs=5):
+    """Best-of-runs full gc.collect() time in ms."""
+    import gc
+    import time
+
+    best = None
+    for _ in range(runs):
+        begin = time.perf_counter()
+        gc.collect()
+        elapsed = (time.perf_counter() - begin) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == "__main__":
+    import gc
+
+    from problem2_health_check import run_health_check
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print("=" * 50)
+    print(f"SERVICE REGISTRY BENCHMARK ({n:,} services)")
+    print("=" * 50)
+
+    baseline_gc = _gc_pause()
+
+    # Dict representation: SERVICES dict + run_health_check services_list
+    def build_dicts():
+        services = _sample_services(n)
+        return services, run_health_check(services)
+
+    # Registry built from the same stream of services
+    def build_registry(include_services):
+        def build():
+            registry = ServiceRegistry()
+            for name, data in _sample_services(n).items():
+                registry.add(name, data['status'], data['response_time'])
+            return registry, registry.health_check(include_services=include_services)
+        return build
+
+    rows = [
+        ('dicts, full report', build_dicts),
+        ('registry, full report', build_registry(True)),
+        ('registry, counts only', build_registry(False)),
+    ]
+    expected_healthy = None
+    print(f"{'':<24}{'bytes/service':>15}{'full GC (ms)':>15}")
+    for label, build in rows:
+        gc.collect()
+        result, allocated = _measure(build)
+        pause = _gc_pause()
+        healthy = result[1]['healthy_count']
+        assert expected_healthy is None or healthy == expected_healthy
+        expected_healthy = healthy
+        del result
+        print(f"{label:<24}{allocated / n:>15.0f}{pause - baseline_gc:>15.2f}")
+
+    print("\n(GC times are above the empty-interpreter baseline of "
+          f"{baseline_gc:.2f} ms)")
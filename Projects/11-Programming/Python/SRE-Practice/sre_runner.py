@@ -0,0 +1,262 @@
+# SRE/DevOps Python Practice - Multi-Tool Runner
+# Using modules: asyncio, concurrent.futures, argparse, json, time
+
+"""
+SRE Runner
+==========
+
+Runs every SRE tool in one Python process and merges the results into a
+single report, instead of three cron entries with three interpreter startups.
+
+Stages:
+    disk    - monitor_disk_usage       (CPU, process pool)
+    backup  - calculate_backup_time    (CPU, process pool)
+    logs    - analyze_logs / analyze_log_file   (CPU, process pool)
+    health  - run_health_check         (I/O, asyncio)
+
+CPU stages are submitted to a ProcessPoolExecutor and awaited from the event
+loop, so they overlap with each other and with the I/O stages. The tool
+modules are imported inside each stage, so only the stages you ask for pay
+their import cost.
+
+Usage:
+    python sre_runner.py
+    python sre_runner.py --log-file /var/log/app.log --stages logs,health
+    python sre_runner.py --workers 0        # threads only, no worker startup
+    python sre_runner.py --calibrate file --calibrate-dir /mnt/backups
+
+Report:
+{
+    'timestamp': '2026-01-07T22:00:00',
+    'total_seconds': 0.12,
+    'stages': {
+        'disk': {'seconds': 0.02, 'compute_seconds': 0.0001, 'result': {...}},
+        'logs': {'seconds': 0.01, 'error': 'FileNotFoundError: ...'},
+        ...
+    },
+    'instrumentation': {'spans': {...}, 'counters': {...}}   # SRE_INSTRUMENT=1
+}
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import instrumentation
+
+CPU_STAGES = ('disk', 'backup', 'logs')
+IO_STAGES = ('health',)
+ALL_STAGES = CPU_STAGES + IO_STAGES
+
+
+# ==================================================
+# STAGES
+# ==================================================
+
+def disk_stage(servers=None):
+    from day2_automation import SAMPLE_SERVERS, monitor_disk_usage
+
+    if servers is None:
+        servers = SAMPLE_SERVERS
+    return monitor_disk_usage(servers)
+
+
+def backup_stage(databases=None, network_speed_gbph=10, calibrate=None, calibrate_kwargs=None):
+    """
+    calibrate: 'socket' or 'file' to use a local-sink probe speed instead of
+    network_speed_gbph; calibrate_kwargs go to the probe (e.g. directory).
+    The result's 'speed_source' says which speed was used.
+    """
+    from day2_automation import SAMPLE_DATABASES, calculate_backup_time
+
+    if databases is None:
+        databases = SAMPLE_DATABASES
+    if calibrate:
+        from backup_throughput import BackupPlanner
+
+        planner = BackupPlanner(databases)
+        planner.calibrate(probe=calibrate, **(calibrate_kwargs or {}))
+        return planner.estimate()
+    return calculate_backup_time(databases, network_speed_gbph)
+
+
+def log_stage(log_file=None):
+    from problem1_log_analyzer import SAMPLE_LOGS, analyze_log_file, analyze_logs
+
+    if log_file:
+        counts, top_errors, error_rate = analyze_log_file(log_file)
+    else:
+        counts, top_errors, error_rate = analyze_logs(SAMPLE_LOGS)
+    return {
+        'counts': dict(counts),
+        'top_errors': [{'message': msg, 'count': count} for msg, count in top_errors],
+        'error_rate': error_rate,
+    }
+
+
+async def health_stage(services=None):
+    from problem2_health_check import SERVICES, run_health_check
+
+    if services is None:
+        services = SERVICES
+    # Simulated checks; real ones would await HTTP requests here
+    return await asyncio.to_thread(run_health_check, services)
+
+
+_CPU_STAGE_FUNCTIONS = {'disk': disk_stage, 'backup': backup_stage, 'logs': log_stage}
+
+
+def _run_cpu_stage(name, kwargs, instrument=False):
+    """
+    Worker entry point: run one CPU stage and return
+    (compute seconds, result, instrumentation snapshot or None).
+
+    Only used in worker processes when instrument is set: their spans and
+    counters would otherwise die with the worker, so they are collected
+    from a clean slate and shipped back with the result.
+    """
+    if instrument:
+        instrumentation.enable()
+        instrumentation.reset()
+    start = time.perf_counter()
+    result = _CPU_STAGE_FUNCTIONS[name](**kwargs)
+    elapsed = time.perf_counter() - start
+    metrics = instrumentation.snapshot(include_buckets=True) if instrument else None
+    return elapsed, result, metrics
+
+
+async def _collect(awaitable, submitted, cpu_stage):
+    """
+    Await one stage and build its report entry. 'seconds' is wall time from
+    submission to result (pool startup and pickling included); a failed
+    stage gets an 'error' instead of a 'result'.
+    """
+    try:
+        result = await awaitable
+    except Exception as e:
+        return {'seconds': time.perf_counter() - submitted, 'error': f"{type(e).__name__}: {e}"}
+    entry = {'seconds': time.perf_counter() - submitted}
+    if cpu_stage:
+        # Also report the time spent computing inside the worker
+        entry['compute_seconds'], result, metrics = result
+        if metrics is not None:
+            instrumentation.merge(metrics)
+    entry['result'] = result
+    return entry
+
+
+# ==================================================
+# RUNNER
+# ==================================================
+
+async def run_stages(stages=ALL_STAGES, stage_kwargs=None, workers=None):
+    """
+    Run the given stages concurrently and return the merged report.
+    Repeated stage names run once; a failing stage does not stop the others.
+    With instrumentation enabled, the report also carries 'instrumentation':
+    one snapshot() merged from this process and every worker process.
+
+    stage_kwargs: {stage_name: {keyword arguments for that stage}}
+    workers: process pool size (None = CPU count, 0 = use threads instead)
+    """
+    stage_kwargs = stage_kwargs or {}
+    stages = list(dict.fromkeys(stages))
+    unknown = set(stages) - set(ALL_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    pool = None
+    if workers != 0 and any(name in CPU_STAGES for name in stages):
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        pending = {}
+        for name in stages:
+            kwargs = stage_kwargs.get(name, {})
+            submitted = time.perf_counter()
+            if name in CPU_STAGES:
+                # Threads (no pool) record straight into this process
+                instrument = pool is not None and instrumentation.is_enabled()
+                stage = loop.run_in_executor(pool, _run_cpu_stage, name, kwargs, instrument)
+            else:
+                stage = health_stage(**kwargs)
+            pending[name] = asyncio.ensure_future(_collect(stage, submitted, name in CPU_STAGES))
+        results = await asyncio.gather(*pending.values())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'total_seconds': time.perf_counter() - start,
+        'stages': dict(zip(pending, results)),
+    }
+    if instrumentation.is_enabled():
+        report['instrumentation'] = instrumentation.snapshot()
+    return report
+
+
+def _non_negative_int(value):
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Run all SRE tools and merge their reports.")
+    parser.add_argument('--stages', default=','.join(ALL_STAGES),
+                        help=f"comma-separated subset of {', '.join(ALL_STAGES)}")
+    parser.add_argument('--log-file', help="log file to analyze (default: SAMPLE_LOGS)")
+    parser.add_argument('--network-speed', type=float, default=10,
+                        help="backup network speed in GB per hour")
+    parser.add_argument('--calibrate', choices=('socket', 'file'),
+                        help="use a local-sink probe speed instead of --network-speed "
+                             "(measures this host, not the real link)")
+    parser.add_argument('--calibrate-dir',
+                        help="directory for the 'file' probe; point it at the backup target")
+    parser.add_argument('--calibrate-streams', type=int, default=1,
+                        help="parallel probe streams")
+    parser.add_argument('--calibrate-chunk-size', type=int, default=1024 * 1024,
+                        help="probe chunk size in bytes")
+    parser.add_argument('--workers', type=_non_negative_int, default=None,
+                        help="process pool size; 0 runs CPU stages in threads")
+    args = parser.parse_args(argv)
+
+    stages = [name.strip() for name in args.stages.split(',') if name.strip()]
+    calibrate_kwargs = {'streams': args.calibrate_streams, 'chunk_size': args.calibrate_chunk_size}
+    if args.calibrate == 'file':
+        calibrate_kwargs['directory'] = args.calibrate_dir
+    stage_kwargs = {
+        'logs': {'log_file': args.log_file},
+        'backup': {
+            'network_speed_gbph': args.network_speed,
+            'calibrate': args.calibrate,
+            'calibrate_kwargs': calibrate_kwargs,
+        },
+    }
+    report = asyncio.run(run_stages(stages, stage_kwargs, args.workers))
+
+    print(json.dumps(report, indent=4))
+    print("\n⏱️ Wall time per stage:")
+    for name, stage in report['stages'].items():
+        status = f"  ERROR {stage['error']}" if 'error' in stage else ''
+        print(f"  {name:<8} {stage['seconds'] * 1000:8.2f} ms{status}")
+    print(f"  {'total':<8} {report['total_seconds'] * 1000:8.2f} ms")
+    return report
+
+
+if __name__ == "__main__":
+    main()